@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import inspect
 import multiprocessing
 import platform
 from abc import ABC
 from copy import deepcopy
-from typing import Callable, Iterable, List, Optional, Tuple, Union
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional, Set, Tuple, Union
 
 from torch.utils.data import DataLoader, RandomSampler, SequentialSampler
 from torch.utils.data.distributed import DistributedSampler
@@ -30,6 +32,31 @@ from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.model_utils import is_overridden
 
 
+def _get_init_arg_names(cls) -> Tuple[Set[str], bool]:
+    """Names of the non-variadic arguments of `cls.__init__` and whether it accepts `**kwargs`,
+    read from its code object when possible."""
+    init = cls.__init__
+    code = getattr(init, '__code__', None)
+    if code is None or hasattr(init, '__wrapped__'):
+        # builtin or decorated `__init__`, the code object does not describe the real signature
+        params = inspect.signature(init).parameters.values()
+        names = {p.name for p in params if p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)}
+        return names, any(p.kind == p.VAR_KEYWORD for p in params)
+    names = set(code.co_varnames[:code.co_argcount + code.co_kwonlyargcount])
+    return names, bool(code.co_flags & inspect.CO_VARKEYWORDS)
+
+
+@lru_cache(maxsize=None)
+def _get_dataloader_init_kwargs_names(dataloader_cls) -> Optional[Set[str]]:
+    """Names of the arguments accepted by the `__init__` of a dataloader class, cached per class.
+    Returns ``None`` if the `__init__` accepts arbitrary `**kwargs`."""
+    names, has_var_kwargs = _get_init_arg_names(dataloader_cls)
+    if has_var_kwargs:
+        return None
+    names.discard('self')
+    return names
+
+
 class TrainerDataLoadingMixin(ABC):
 
     # this is just a summary on variables used in this abstract class,
@@ -110,11 +137,15 @@ class TrainerDataLoadingMixin(ABC):
         return dataloader
 
     def replace_sampler(self, dataloader, sampler):
-        skip_keys = ['sampler', 'batch_sampler', 'dataset_kind']
+        skip_keys = ('sampler', 'batch_sampler', 'dataset_kind')
+        valid_kwargs = _get_dataloader_init_kwargs_names(type(dataloader))
 
-        dl_args = {
-            k: v for k, v in dataloader.__dict__.items() if not k.startswith('_') and k not in skip_keys
-        }
+        attrs = vars(dataloader)
+        if valid_kwargs is None:
+            # the `__init__` takes `**kwargs`, so pass all public attributes through
+            dl_args = {k: v for k, v in attrs.items() if not k.startswith('_') and k not in skip_keys}
+        else:
+            dl_args = {k: attrs[k] for k in valid_kwargs if k in attrs and k not in skip_keys}
 
         dl_args['sampler'] = sampler
         dl_args['shuffle'] = False
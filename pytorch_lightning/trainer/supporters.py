@@ -41,16 +41,28 @@ class TensorRunningAccum(object):
         (tensor(12.), tensor(10.), tensor(8.), tensor(12.))
     """
 
+    __slots__ = ('window_length', 'memory', 'current_idx', 'last_idx', 'rotated', '_mean', '_min', '_max')
+
     def __init__(self, window_length: int):
         self.window_length = window_length
         self.memory = None
         self.current_idx: int = 0
         self.last_idx: Optional[int] = None
         self.rotated: bool = False
+        # aggregates are computed on demand and cached until the next append
+        self._mean = None
+        self._min = None
+        self._max = None
 
     def reset(self) -> None:
         """Empty the accumulator."""
-        self.__init__(self.window_length)
+        # keep the allocated buffer, it gets overwritten by the following appends
+        self.current_idx = 0
+        self.last_idx = None
+        self.rotated = False
+        self._mean = None
+        self._min = None
+        self._max = None
 
     def last(self):
         """Get the last added element."""
@@ -59,24 +71,26 @@ class TensorRunningAccum(object):
 
     def append(self, x):
         """Add an element to the accumulator."""
-        if self.memory is None:
-            self.memory = torch.zeros(self.window_length, *x.shape)
-
-        # ensure same device and type
-        if self.memory.device != x.device or self.memory.type() != x.type():
-            x = x.to(self.memory)
+        if self.last_idx is None and (
+            self.memory is None or self.memory.shape[1:] != x.shape or self.memory.device != x.device
+        ):
+            # keep the buffer on the device of the incoming values to avoid a host sync per append
+            self.memory = torch.zeros(self.window_length, *x.shape, device=x.device)
 
-        # store without grads
+        # store without grads, `copy_` casts to the device and type of the buffer
         with torch.no_grad():
-            self.memory[self.current_idx] = x
+            self.memory[self.current_idx].copy_(x)
             self.last_idx = self.current_idx
 
-        # increase index
-        self.current_idx += 1
+        # invalidate the cached aggregates
+        self._mean = None
+        self._min = None
+        self._max = None
 
-        # reset index when hit limit of tensor
-        self.current_idx = self.current_idx % self.window_length
-        if self.current_idx == 0:
+        # increase index and reset it when hit limit of tensor
+        self.current_idx += 1
+        if self.current_idx == self.window_length:
+            self.current_idx = 0
             self.rotated = True
 
     def mean(self):
@@ -93,13 +107,17 @@ class TensorRunningAccum(object):
 
     def _agg_memory(self, how: str):
         if self.last_idx is not None:
-            if self.rotated:
-                return getattr(self.memory, how)()
-            else:
-                return getattr(self.memory[: self.current_idx], how)()
+            attr = f'_{how}'
+            if getattr(self, attr) is None:
+                memory = self.memory if self.rotated else self.memory[:self.current_idx]
+                with torch.no_grad():
+                    setattr(self, attr, getattr(memory, how)())
+            return getattr(self, attr)
 
 
 class Accumulator(object):
+    __slots__ = ('num_values', 'total')
+
     def __init__(self):
         self.num_values = 0
         self.total = 0
@@ -119,18 +137,30 @@ class PredictionCollection(object):
         self.world_size = world_size
         self.predictions = {}
         self.num_predictions = 0
+        self._tensor_features = {}
+
+    @staticmethod
+    def _compact(values: Tensor) -> Tensor:
+        """Copy the values so that a stored view does not keep its whole base tensor alive."""
+        return values.detach().clone()
 
     def _add_prediction(self, name, values, filename):
         if filename not in self.predictions:
-            self.predictions[filename] = {name: values}
-        elif name not in self.predictions[filename]:
-            self.predictions[filename][name] = values
-        elif isinstance(values, Tensor):
-            self.predictions[filename][name] = torch.cat(
-                (self.predictions[filename][name], values)
-            )
+            self.predictions[filename] = {}
+            self._tensor_features[filename] = set()
+        features = self.predictions[filename]
+
+        if name not in features:
+            if isinstance(values, Tensor):
+                # keep the per-batch chunks and concatenate them only once in `to_disk`
+                features[name] = [self._compact(values)]
+                self._tensor_features[filename].add(name)
+            else:
+                features[name] = values
+        elif name in self._tensor_features[filename]:
+            features[name].append(self._compact(values))
         elif isinstance(values, list):
-            self.predictions[filename][name].extend(values)
+            features[name].extend(values)
 
     def add(self, predictions):
 
@@ -145,6 +175,7 @@ class PredictionCollection(object):
         """Write predictions to file(s).
         """
         for filepath, predictions in self.predictions.items():
+            tensor_features = self._tensor_features[filepath]
             fs = get_filesystem(filepath)
             # normalize local filepaths only
             if fs.protocol == "file":
@@ -155,9 +186,9 @@ class PredictionCollection(object):
             dirpath = os.path.split(filepath)[0]
             fs.mkdirs(dirpath, exist_ok=True)
 
-            # Convert any tensor values to list
+            # Concatenate the staged tensor chunks and convert them to list with a single host transfer
             predictions = {
-                k: v if not isinstance(v, Tensor) else v.tolist()
+                k: torch.cat(v).tolist() if k in tensor_features else v
                 for k, v in predictions.items()
             }
 
@@ -169,10 +200,8 @@ class PredictionCollection(object):
                 )
 
             # Switch predictions so each entry has its own dict
-            outputs = []
-            for values in zip(*predictions.values()):
-                output_element = {k: v for k, v in zip(predictions.keys(), values)}
-                outputs.append(output_element)
+            keys = tuple(predictions.keys())
+            outputs = [dict(zip(keys, values)) for values in zip(*predictions.values())]
 
             # Write predictions for current file to disk
             with fs.open(filepath, "wb") as fp:
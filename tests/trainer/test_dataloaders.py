@@ -1160,3 +1160,46 @@ def test_replace_sampler_with_multiprocessing_context(tmpdir):
 
     new_data_loader = trainer.replace_sampler(train, SequentialSampler(train.dataset))
     assert (new_data_loader.multiprocessing_context == train.multiprocessing_context)
+
+
+def test_replace_sampler_ignores_non_init_attributes(tmpdir):
+    """
+    This test verifies that replace_sampler only passes arguments known to the dataloader's `__init__`
+    """
+
+    class CustomDataLoader(DataLoader):
+
+        def __init__(self, dataset, custom_arg=None, batch_size=1, shuffle=False, sampler=None):
+            super().__init__(dataset, batch_size=batch_size, shuffle=shuffle, sampler=sampler)
+            self.custom_arg = custom_arg
+            self.not_an_init_arg = True
+
+    dataloader = CustomDataLoader(RandomDataset(32, 64), custom_arg=5, batch_size=4)
+    trainer = Trainer(default_root_dir=tmpdir)
+
+    new_dataloader = trainer.replace_sampler(dataloader, SequentialSampler(dataloader.dataset))
+    assert isinstance(new_dataloader, CustomDataLoader)
+    assert isinstance(new_dataloader.sampler, SequentialSampler)
+    assert new_dataloader.custom_arg == 5
+    assert new_dataloader.batch_size == 4
+
+
+def test_replace_sampler_passes_attributes_to_var_kwargs_init(tmpdir):
+    """
+    This test verifies that replace_sampler passes all public attributes to an `__init__` taking `**kwargs`
+    """
+
+    class CustomDataLoader(DataLoader):
+
+        def __init__(self, dataset, **kwargs):
+            self.custom_attr = kwargs.pop('custom_attr', None)
+            super().__init__(dataset, **kwargs)
+
+    dataloader = CustomDataLoader(RandomDataset(32, 64), custom_attr=5, batch_size=4)
+    trainer = Trainer(default_root_dir=tmpdir)
+
+    new_dataloader = trainer.replace_sampler(dataloader, SequentialSampler(dataloader.dataset))
+    assert isinstance(new_dataloader, CustomDataLoader)
+    assert isinstance(new_dataloader.sampler, SequentialSampler)
+    assert new_dataloader.custom_attr == 5
+    assert new_dataloader.batch_size == 4
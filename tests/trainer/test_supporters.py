@@ -11,14 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+
 import pytest
 import torch
 
-from pytorch_lightning.trainer.supporters import TensorRunningAccum
+from pytorch_lightning.trainer.supporters import PredictionCollection, TensorRunningAccum
 
 
 def test_tensor_running_accum_reset():
-    """ Test that reset would set all attributes to the initialization state """
+    """ Test that reset would set all attributes to the initialization state but keep the buffer """
 
     window_length = 10
 
@@ -30,9 +32,77 @@ def test_tensor_running_accum_reset():
     assert accum.last() == torch.tensor(1.5)
     assert accum.mean() == torch.tensor(1.5)
 
+    memory = accum.memory
     accum.reset()
     assert accum.window_length == window_length
-    assert accum.memory is None
+    assert accum.memory is memory
     assert accum.current_idx == 0
     assert accum.last_idx is None
     assert not accum.rotated
+    assert accum.last() is None
+    assert accum.mean() is None
+
+    accum.append(torch.tensor(3.5))
+    assert accum.memory is memory
+    assert accum.last() == torch.tensor(3.5)
+    assert accum.mean() == torch.tensor(3.5)
+
+
+@pytest.mark.parametrize("num_values", [3, 5, 13])
+def test_tensor_running_accum_aggregates(num_values):
+    """ Test that the cached aggregates match a full reduction over the window """
+
+    window_length = 5
+    values = torch.rand(num_values)
+
+    accum = TensorRunningAccum(window_length=window_length)
+    for value in values:
+        accum.append(value)
+
+    window = values[-window_length:]
+    assert torch.allclose(accum.mean(), window.mean())
+    assert accum.min() == window.min()
+    assert accum.max() == window.max()
+
+
+def test_tensor_running_accum_recovers_from_non_finite():
+    """ Test that a non-finite value only affects the aggregates while it is in the window """
+
+    accum = TensorRunningAccum(window_length=3)
+    for value in (float('inf'), float('nan'), 1., 2., 3.):
+        accum.append(torch.tensor(value))
+
+    assert accum.mean() == torch.tensor(2.)
+    assert accum.min() == torch.tensor(1.)
+    assert accum.max() == torch.tensor(3.)
+
+
+def test_prediction_collection_to_disk(tmpdir):
+    """ Test that tensor and list predictions added over several batches are written row by row """
+
+    filename = os.path.join(tmpdir, 'predictions.pt')
+    collection = PredictionCollection(global_rank=0, world_size=1)
+    collection.add({filename: {'ids': torch.tensor([0, 1]), 'preds': ['cat', 'dog']}})
+    collection.add({filename: {'ids': torch.tensor([2]), 'preds': ['bird']}})
+    collection.to_disk()
+
+    predictions = torch.load(filename)
+    assert predictions == [
+        {'ids': 0, 'preds': 'cat'},
+        {'ids': 1, 'preds': 'dog'},
+        {'ids': 2, 'preds': 'bird'},
+    ]
+
+
+def test_prediction_collection_stores_compact_copies(tmpdir):
+    """ Test that tensor predictions written as views do not keep their base tensors alive """
+
+    filename = os.path.join(tmpdir, 'predictions.pt')
+    collection = PredictionCollection(global_rank=0, world_size=1)
+    for _ in range(2):
+        logits = torch.rand(4, 10)
+        collection.add({filename: {'preds': logits[:, 1]}})
+
+    for chunk in collection.predictions[filename]['preds']:
+        assert chunk._base is None
+        assert chunk.storage().size() == 4